@@ -20,6 +20,7 @@
 class DropoutIE(InfoExtractor):
     _LOGIN_URL = 'https://www.dropout.tv/login'
     _NETRC_MACHINE = 'dropout'
+    _login_error = None
 
     _VALID_URL = r'https?://(?:www\.)?dropout\.tv/(?:[^/]+/)*videos/(?P<id>[^/]+)/?$'
     _TESTS = [
@@ -102,6 +103,9 @@ def _login(self, display_id):
         username, password = self._get_login_info()
         if not username:
             return True
+        if self._login_error:
+            # Retrying a rejected login for every video would only repeat the same requests
+            return self._login_error
 
         response = self._download_webpage(
             self._LOGIN_URL, display_id, note='Logging in', fatal=False,
@@ -117,9 +121,10 @@ def _login(self, display_id):
         if user_has_subscription.lower() == 'true':
             return
         elif user_has_subscription.lower() == 'false':
-            return 'Account is not subscribed'
+            self._login_error = 'Account is not subscribed'
         else:
-            return 'Incorrect username/password'
+            self._login_error = 'Incorrect username/password'
+        return self._login_error
 
     def _real_extract(self, url):
         display_id = self._match_id(url)
@@ -129,7 +134,9 @@ def _real_extract(self, url):
             webpage = self._download_webpage(url, display_id)
         if not webpage or '<div id="watch-unauthorized"' in webpage:
             login_err = self._login(display_id)
-            webpage = self._download_webpage(url, display_id)
+            # The page can only change if there was none yet or the login went through
+            if not webpage or login_err is None:
+                webpage = self._download_webpage(url, display_id)
             if login_err and '<div id="watch-unauthorized"' in webpage:
                 if login_err is True:
                     self.raise_login_required(method='any')
@@ -140,8 +147,9 @@ def _real_extract(self, url):
         watch_info = get_element_by_id('watch-info', webpage) or ''
 
         title = clean_html(get_element_by_class('video-title', watch_info))
+        text_html = get_element_by_class('text', watch_info)
         season_episode = get_element_by_class(
-            'site-font-secondary-color', get_element_by_class('text', watch_info))
+            'site-font-secondary-color', text_html) if text_html else None
         episode_number = int_or_none(self._search_regex(
             r'Episode (\d+)', season_episode or '', 'episode', default=None))
 
@@ -153,7 +161,7 @@ def _real_extract(self, url):
             'display_id': display_id,
             'title': title,
             'description': self._html_search_meta('description', webpage, fatal=False),
-            'thumbnail': thumbnail.split('?')[0] if thumbnail else None,  # Ignore crop/downscale
+            'thumbnail': thumbnail.partition('?')[0] if thumbnail else None,  # Ignore crop/downscale
             'series': clean_html(get_element_by_class('series-title', watch_info)),
             'episode_number': episode_number,
             'episode': title if episode_number else None,
@@ -16,6 +16,10 @@
 )
 from ..utils.traversal import traverse_obj
 
+_PLAYER_RE = re.compile(r'https?://(?P<domain>[\w.-]+)(/(?P<channel>[\w.-]+))?/(?:live|video|audio)/(?P<code>sm\w+)')
+_VIDEOS_RE = re.compile(r'https?://(?P<domain>[\w.-]+)(/(?P<channel>[\w.-]+))?/videos')
+_LIVES_RE = re.compile(r'https?://(?P<domain>[\w.-]+)(/(?P<channel>[\w.-]+))?/lives')
+
 
 class SheetaEmbedIE(InfoExtractor):
     IE_NAME = 'sheeta'
@@ -357,10 +361,14 @@ class SheetaEmbedIE(InfoExtractor):
     _FANCLUB_GROUP_ID = None
     _FANCLUB_SITE_ID_AUTH = None
     _FANCLUB_SITE_ID_INFO = None
+    _AUTHED_HEADERS = None
 
     _LIST_PAGE_SIZE = 12
     _LOGIN_METHOD = 'password'
 
+    _site_settings_cache = {}
+    _fanclub_site_id_cache = {}
+
     def _extract_from_url(self, url):
         parsed_url = urllib.parse.urlparse(url)
         if '/videos' in parsed_url.path:
@@ -385,14 +393,8 @@ def _call_api_authed(self, path, item_id, **kwargs):
             404: 'Members-only content',
             408: 'Outdated token',
         }
-        headers = filter_dict({
-            'Content-Type': 'application/json',
-            'fc_use_device': 'null',
-            'origin': f'https://{self._DOMAIN}',
-        })
-
         try:
-            return self._call_api(path, item_id, headers=headers, **kwargs)
+            return self._call_api(path, item_id, headers=self._AUTHED_HEADERS, **kwargs)
         except ExtractorError as e:
             if not isinstance(e.cause, HTTPError) or e.cause.status not in expected_code_msg:
                 raise e
@@ -401,6 +403,10 @@ def _call_api_authed(self, path, item_id, **kwargs):
             return None
 
     def _find_fanclub_site_id(self, channel_id):
+        cache_key = (self._DOMAIN, channel_id)
+        if cache_key in self._fanclub_site_id_cache:
+            return self._fanclub_site_id_cache[cache_key]
+
         fanclub_list_json = self._call_api(
             'content_providers/channel_domain', f'channels/{channel_id}',
             query={'current_site_domain': urllib.parse.quote(f'https://{self._DOMAIN}/{channel_id}')},
@@ -408,18 +414,26 @@ def _find_fanclub_site_id(self, channel_id):
         )
         if fanclub_id := traverse_obj(
                 fanclub_list_json, ('data', 'content_providers', 'id', {int_or_none}), get_all=False):
+            self._fanclub_site_id_cache[cache_key] = fanclub_id
             return fanclub_id
         raise ExtractorError(f'Channel {channel_id} does not exist', expected=True)
 
     def _extract_base_info(self, channel_id):
-        site_settings = self._download_json(
-            f'https://{self._DOMAIN}/site/settings.json', None,
-            note='Fetching site settings', errnote='Unable to fetch site settings')
-        self.write_debug(f'site_settings = {site_settings!r}')
+        site_settings = self._site_settings_cache.get(self._DOMAIN)
+        if not site_settings:
+            site_settings = self._site_settings_cache[self._DOMAIN] = self._download_json(
+                f'https://{self._DOMAIN}/site/settings.json', None,
+                note='Fetching site settings', errnote='Unable to fetch site settings')
+            self.write_debug(f'site_settings = {site_settings!r}')
 
         self._API_BASE_URL = site_settings['api_base_url']
         self._FANCLUB_GROUP_ID = site_settings['fanclub_group_id']
         self._FANCLUB_SITE_ID_AUTH = site_settings['fanclub_site_id']
+        self._AUTHED_HEADERS = {
+            'Content-Type': 'application/json',
+            'fc_use_device': 'null',
+            'origin': f'https://{self._DOMAIN}',
+        }
 
         if channel_id:
             self._FANCLUB_SITE_ID_INFO = self._find_fanclub_site_id(channel_id)
@@ -438,7 +452,7 @@ def _channel_user_info(self):
         return traverse_obj(self._call_api(
             f'fanclub_sites/{self._FANCLUB_SITE_ID_INFO}/user_info', f'fanclub_sites/{self._FANCLUB_SITE_ID_INFO}',
             note='Fetching channel user info', errnote='Unable to fetch channel user info', fatal=False,
-            data=json.dumps('null').encode(),
+            data=b'"null"',
         ), ('data', 'fanclub_site', {dict})) or {}
 
     def _extract_channel_info(self, channel_id):
@@ -458,9 +472,7 @@ def _extract_channel_info(self, channel_id):
         }
 
     def _extract_player_page(self, url):
-        self._DOMAIN, channel_id, content_code = re.match(
-            r'https?://(?P<domain>[\w.-]+)(/(?P<channel>[\w.-]+))?/(?:live|video|audio)/(?P<code>sm\w+)', url,
-        ).group('domain', 'channel', 'code')
+        self._DOMAIN, channel_id, content_code = _PLAYER_RE.match(url).group('domain', 'channel', 'code')
         self._extract_base_info(channel_id)
 
         data_json = self._call_api(
@@ -613,21 +625,21 @@ def _yield_formats(self, data_json, live_status, content_code):
                     'acodec': 'aac',
                 }
 
-    def _fetch_paged_channel_video_list(self, path, query, channel, item_id, page):
-        response = self._call_api(
-            path, item_id, query={
+    def _fetch_paged_channel_video_list(self, api_url, query, video_url_prefix, item_id, page):
+        page += 1
+        response = self._download_json(
+            api_url, item_id, query={
                 **query,
-                'page': (page + 1),
+                'page': page,
                 'per_page': self._LIST_PAGE_SIZE,
             },
             headers={'fc_use_device': 'null'},
-            note=f'Fetching channel info (page {page + 1})',
-            errnote=f'Unable to fetch channel info (page {page + 1})')
+            note=f'Fetching channel info (page {page})',
+            errnote=f'Unable to fetch channel info (page {page})')
 
         for content_code in traverse_obj(
                 response, ('data', 'video_pages', 'list', ..., 'content_code', {str})):
-            yield self.url_result('/'.join(filter(
-                None, [f'https://{self._DOMAIN}', channel, 'video', content_code])))
+            yield self.url_result(video_url_prefix + content_code)
 
     def _extract_video_list_page(self, url):
         """
@@ -647,9 +659,7 @@ def _extract_video_list_page(self, url):
                 7 無料 (free)
         """
 
-        self._DOMAIN, channel_id = re.match(
-            r'https?://(?P<domain>[\w.-]+)(/(?P<channel>[\w.-]+))?/videos', url,
-        ).group('domain', 'channel')
+        self._DOMAIN, channel_id = _VIDEOS_RE.match(url).group('domain', 'channel')
         self._extract_base_info(channel_id)
 
         channel_info = self._extract_channel_info(channel_id)
@@ -660,13 +670,14 @@ def _extract_video_list_page(self, url):
         return self.playlist_result(
             OnDemandPagedList(
                 functools.partial(
-                    self._fetch_paged_channel_video_list, f'fanclub_sites/{self._FANCLUB_SITE_ID_INFO}/video_pages',
+                    self._fetch_paged_channel_video_list,
+                    f'{self._API_BASE_URL}/fanclub_sites/{self._FANCLUB_SITE_ID_INFO}/video_pages',
                     filter_dict({
                         'tag': traverse_obj(qs, ('tag', 0)),
                         'sort': traverse_obj(qs, ('sort', 0), default='-display_date'),
                         'vod_type': traverse_obj(qs, ('vodType', 0), default='0'),
                     }),
-                    channel_id, f'{full_channel_id}/videos'),
+                    f'{channel_info["channel_url"]}/video/', f'{full_channel_id}/videos'),
                 self._LIST_PAGE_SIZE),
             playlist_id=f'{full_channel_id}/videos', playlist_title=f'{channel_name}-videos')
 
@@ -681,9 +692,7 @@ def _extract_live_list_page(self, url):
             We use "4" instead of "3" because some recently ended live streams could not be downloaded.
         """
 
-        self._DOMAIN, channel_id = re.match(
-            r'https?://(?P<domain>[\w.-]+)(/(?P<channel>[\w.-]+))?/lives', url,
-        ).group('domain', 'channel')
+        self._DOMAIN, channel_id = _LIVES_RE.match(url).group('domain', 'channel')
         self._extract_base_info(channel_id)
 
         channel_info = self._extract_channel_info(channel_id)
@@ -693,7 +702,8 @@ def _extract_live_list_page(self, url):
         return self.playlist_result(
             OnDemandPagedList(
                 functools.partial(
-                    self._fetch_paged_channel_video_list, f'fanclub_sites/{self._FANCLUB_SITE_ID_INFO}/live_pages',
-                    {'live_type': 4}, channel_id, f'{full_channel_id}/lives'),
+                    self._fetch_paged_channel_video_list,
+                    f'{self._API_BASE_URL}/fanclub_sites/{self._FANCLUB_SITE_ID_INFO}/live_pages',
+                    {'live_type': 4}, f'{channel_info["channel_url"]}/video/', f'{full_channel_id}/lives'),
                 self._LIST_PAGE_SIZE),
             playlist_id=f'{full_channel_id}/lives', playlist_title=f'{channel_name}-lives')